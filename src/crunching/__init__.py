@@ -1,5 +1,6 @@
 
 
+from collections import namedtuple
 from copy import copy
 from typing import Callable, Generic, List, TypeVar, Union, Optional, \
     Tuple as TupleType
@@ -193,6 +194,80 @@ class Tuple(Parser[T]):
         return parse
 
 
+def _uses_namedtuple_new(result_type: type) -> bool:
+    for base in result_type.__mro__:
+        if base.__bases__ == (tuple,) and "_make" in base.__dict__:
+            return result_type.__new__ is base.__new__
+    return False
+
+
+class Struct(Parser[T]):
+    """Named fields are ``(name, parser)`` pairs, results of other parsers
+    (e.g. ``Tag("=")``) are skipped."""
+
+    def __init__(self, result_type: Union[str, type], *fields):
+        self.fields = []
+        for field in fields:
+            if isinstance(field, tuple):
+                if len(field) != 2 or not isinstance(field[0], str):
+                    raise TypeError(
+                        f"field {field!r} is not a (name, parser) pair")
+                self.fields.append((field[0], into_parser(field[1])))
+            else:
+                self.fields.append((None, into_parser(field)))
+        field_names = [
+            field_name for field_name, _ in self.fields
+            if field_name is not None
+        ]
+
+        if isinstance(result_type, str):
+            self.result_type = namedtuple(result_type, field_names)
+        else:
+            if not (isinstance(result_type, type)
+                    and issubclass(result_type, tuple)
+                    and hasattr(result_type, "_fields")):
+                raise TypeError(
+                    f"result type {result_type!r} is not a namedtuple type")
+            if tuple(field_names) != tuple(result_type._fields):
+                raise ValueError(
+                    f"fields {field_names!r} do not match fields "
+                    f"{result_type._fields!r} of {result_type.__name__}")
+            self.result_type = result_type
+
+    def _as_parser(self):
+        fields_len = len(self.fields)
+        namespace = {
+            "_NOT_MATCHING": NOT_MATCHING,
+            "_tuple_new": tuple.__new__,
+            "_result_type": self.result_type,
+        }
+        lines = ["def parse(ipt, start, end):"]
+        results = []
+        for i, (field_name, parser) in enumerate(self.fields):
+            namespace[f"_parser_{i}"] = parser.as_parser()
+            result = f"result_{i}" if field_name is not None else "_"
+            if field_name is not None:
+                results.append(result)
+            lines.append("    old_start = start")
+            lines.append(f"    start, {result} = _parser_{i}(ipt, start, end)")
+            lines.append("    if start < 0:")
+            lines.append("        return _NOT_MATCHING")
+            lines.append("    assert start > old_start")
+            if i != fields_len - 1:
+                lines.append("    if start == end:")
+                lines.append("        return _NOT_MATCHING")
+        if _uses_namedtuple_new(self.result_type):
+            results_tuple = "".join(f"{result}, " for result in results)
+            lines.append(
+                f"    return start, _tuple_new(_result_type, ({results_tuple}))")
+        else:
+            lines.append(
+                f"    return start, _result_type({', '.join(results)})")
+
+        exec("\n".join(lines), namespace)
+        return namespace["parse"]
+
+
 class MapRes(Generic[T, U], Parser[U]):
     def __init__(self, parser, mapper: Callable[[T], U]):
         self.parser = into_parser(parser)
@@ -1,5 +1,7 @@
 # -*- coding=utf-8 -*-
-from crunching import Charset
+from collections import namedtuple
+
+from crunching import Charset, Struct
 
 seperators = Charset("()<>@,;:\\\"/[]?={} \t")
 ctl = Charset("".join([chr(i) for i in range(32)]) + "\x127")
@@ -15,10 +17,10 @@ filename_parm = Alt(Tuple(Tag("filename"), Tag("="), value),
                     Tuple(Tag("filename*"), Tag("="), ext_value))
 disposition_parm = Alt(filename_parm, disp_ext_param)
 
-disp_ext_parm = MapRes(
-    Alt(Tuple(token, Tag("="), value),
-        Tuple(ext_token, Tag("="), ext_value),
-    lambda res: (res[0], res[2])
+DispExtParm = namedtuple("DispExtParm", ["name", "value"])
+disp_ext_parm = Alt(
+    Struct(DispExtParm, ("name", token), Tag("="), ("value", value)),
+    Struct(DispExtParm, ("name", ext_token), Tag("="), ("value", ext_value)),
 )
 ext_token = MapRes(Tuple(token, Tag("*")), lambda res: res[0])
 quoted_string = Delimited(Tag("\""), Many(Alt(qdtext, quoted_pair)), Tag("\""))
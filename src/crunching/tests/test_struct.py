@@ -0,0 +1,98 @@
+# -*- coding=utf-8 -*-
+import pickle
+from collections import namedtuple
+from typing import NamedTuple
+
+import pytest
+
+from crunching import NOT_MATCHING, Charset, Many, MapRes, Struct, Tag, \
+    Tuple, parse
+
+Param = namedtuple("Param", ["name", "value"])
+
+name = Many(Charset("abc"))
+value = Many(Charset("xyz"))
+param = Struct(Param, ("name", name), "=", ("value", value))
+
+
+def run(parser, ipt):
+    return parser.as_parser()(ipt, 0, len(ipt))
+
+
+def test_match_skips_unnamed_fields():
+    assert parse(param, "ab=xyq") == ("q", Param(["a", "b"], ["x", "y"]))
+    assert parse(param, "ab=xy")[1].name == ["a", "b"]
+
+
+def test_matches_map_res_tuple():
+    mapped = MapRes(Tuple(name, "=", value), lambda res: (res[0], res[2]))
+    for ipt in ["ab=xy", "a=z", "cab=zzx-"]:
+        assert parse(param, ipt) == parse(mapped, ipt)
+
+
+def test_fail_on_middle_field():
+    assert run(param, "ab-xy") == NOT_MATCHING
+
+
+def test_fail_on_last_field():
+    parser = Struct("P", ("name", name), "=", ("value", Tag("xy")))
+    assert run(parser, "ab=zz") == NOT_MATCHING
+
+
+def test_end_of_input_before_last_field():
+    assert run(param, "ab") == NOT_MATCHING
+    assert run(param, "ab=") == NOT_MATCHING
+
+
+def test_no_named_fields():
+    parser = Struct("Empty", "a", "b")
+    assert parse(parser, "abc") == ("c", ())
+    assert type(parse(parser, "abc")[1]).__name__ == "Empty"
+
+
+def test_invalid_field_names():
+    with pytest.raises(ValueError):
+        Struct("P", ("name", name), ("name", value))
+    with pytest.raises(ValueError):
+        Struct("P", ("not valid", name))
+    with pytest.raises(ValueError):
+        Struct(Param, ("name", name), ("other", value))
+    with pytest.raises(TypeError, match="not a \\(name, parser\\) pair"):
+        Struct("P", ("name",))
+    with pytest.raises(TypeError, match="not a \\(name, parser\\) pair"):
+        Struct("P", ("name", name, value))
+    with pytest.raises(TypeError, match="not a \\(name, parser\\) pair"):
+        Struct("P", (name, value))
+    with pytest.raises(TypeError, match="not a namedtuple type"):
+        Struct(tuple, ("name", name))
+
+
+def test_shared_result_type():
+    other = Struct(Param, ("name", Tag("q")), ":", ("value", value))
+    assert type(parse(other, "q:x")[1]) is type(parse(param, "a=x")[1])
+
+
+def test_pickle():
+    result = parse(param, "ab=xy")[1]
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_typing_named_tuple():
+    class TypedParam(NamedTuple):
+        name: list
+        value: list
+
+    parser = Struct(TypedParam, ("name", name), "=", ("value", value))
+    assert parse(parser, "a=x") == ("", TypedParam(["a"], ["x"]))
+
+
+def test_overridden_new_is_called():
+    class JoinedParam(Param):
+        __slots__ = ()
+
+        def __new__(cls, name, value):
+            return super().__new__(cls, "".join(name), "".join(value))
+
+    parser = Struct(JoinedParam, ("name", name), "=", ("value", value))
+    assert parse(parser, "ab=xy") == ("", JoinedParam("ab", "xy"))
+    assert parse(parser, "ab=xy")[1].name == "ab"
@@ -0,0 +1,49 @@
+# -*- coding=utf-8 -*-
+from collections import namedtuple
+
+import pytest
+
+from crunching import Charset, Many, MapRes, Struct, Tag, Tuple
+
+pytest.importorskip("pytest_benchmark")
+
+Param = namedtuple("Param", ["name", "value"])
+
+tag_testdata = "name=value"
+many_testdata = "abcabcabc=xyzxyzxyz"
+
+
+def run_benchmark(benchmark, parser, testdata):
+    parser = parser.as_parser()
+    len_input = len(testdata)
+
+    @benchmark
+    def parse_me():
+        return parser(testdata, 0, len_input)
+
+
+def test_struct_tag_perf(benchmark):
+    run_benchmark(benchmark, Struct(
+        Param, ("name", Tag("name")), "=", ("value", Tag("value"))),
+        tag_testdata)
+
+
+def test_map_res_tuple_tag_perf(benchmark):
+    run_benchmark(benchmark, MapRes(
+        Tuple(Tag("name"), "=", Tag("value")),
+        lambda res: Param(res[0], res[2])),
+        tag_testdata)
+
+
+def test_struct_many_perf(benchmark):
+    run_benchmark(benchmark, Struct(
+        Param,
+        ("name", Many(Charset("abc"))), "=", ("value", Many(Charset("xyz")))),
+        many_testdata)
+
+
+def test_map_res_tuple_many_perf(benchmark):
+    run_benchmark(benchmark, MapRes(
+        Tuple(Many(Charset("abc")), "=", Many(Charset("xyz"))),
+        lambda res: Param(res[0], res[2])),
+        many_testdata)